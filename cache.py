@@ -1,6 +1,15 @@
+import heapq
+import itertools
 import threading
-import time
-from typing import Any, Dict, Optional, TypedDict
+from collections import OrderedDict
+from time import monotonic as _now
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+# Expiry-heap items examined per get/put to amortize TTL cleanup
+_EXPIRED_PER_OP = 2
+
+# A full LRU shard evicts max_size // _EVICT_BATCH_DIVISOR entries at once
+_EVICT_BATCH_DIVISOR = 64
 
 
 class CacheStats(TypedDict):
@@ -14,50 +23,244 @@ class CacheStats(TypedDict):
     expired_removals: int
 
 
-class CacheNode:
-    """Node in the doubly linked list for LRU tracking."""
-    def __init__(self, key: str, value: Any, expiry: float = 0):
-        self.key = key
-        self.value = value
-        self.expiry = expiry  # Timestamp when this entry expires (0 means no expiration)
-        self.prev = None
-        self.next = None
+class _Shard:
+    """An independent slice of the cache with its own LRU order, stats and lock."""
+    __slots__ = ("max_size", "evict_batch", "data", "expiry_heap", "heap_seq", "hits",
+                 "misses", "evictions", "expired_removals", "snapshots", "lock")
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # Entries evicted together once the shard overflows
+        self.evict_batch = max(1, max_size // _EVICT_BATCH_DIVISOR)
+        # Key -> (value, expiry); insertion order is LRU order, most recently used last.
+        # Expiry is a time.monotonic() deadline; 0 means the entry never expires.
+        self.data: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        # Min-heap of (expiry, seq, key) for entries with a TTL. The unique seq from
+        # heap_seq breaks ties between equal expiries, so keys are never compared
+        # (they need not be orderable). Entries are never removed eagerly: one whose
+        # key was deleted or re-put with another expiry is stale and is skipped
+        # when it reaches the top.
+        self.expiry_heap: List[Tuple[float, int, str]] = []
+        self.heap_seq = itertools.count()
+        
+        # Statistics. Each counter is bumped with next(), a single C call that is
+        # atomic under the GIL, so it can be updated without holding the lock.
+        # Reading a counter also advances it, so get_stats subtracts the number
+        # of earlier reads, tracked by ``snapshots`` (under the cache's stats lock).
+        self.hits = itertools.count()
+        self.misses = itertools.count()
+        self.evictions = itertools.count()
+        self.expired_removals = itertools.count()
+        self.snapshots = itertools.count()
+        
+        self.lock = threading.Lock()  # Plain (non-reentrant) lock; see ThreadSafeCache
+    
+    def insert(self, key: str, value: Any, expiry: float) -> None:
+        """Store an entry as most recently used, evicting if over capacity.
+        
+        The caller holds the lock and indexes ``expiry`` in the expiry heap.
+        """
+        data = self.data
+        size = len(data)
+        data[key] = (value, expiry)
+        if len(data) == size:
+            # Updated an existing key: mark it as most recently used
+            # (new keys are already appended at the most recent end)
+            data.move_to_end(key)
+        
+        # Evict a batch of least recently used entries if we are over capacity,
+        # so subsequent puts do not each pay for an eviction
+        if len(data) > self.max_size:
+            evictions = self.evictions
+            for _ in range(self.evict_batch):
+                data.popitem(last=False)
+                next(evictions)
+    
+    def rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale items.
+        
+        Called once the heap outgrows twice the shard capacity, so frequently
+        updated keys cannot grow it without bound.
+        """
+        self.expiry_heap = self.live_expiries()
+        heapq.heapify(self.expiry_heap)
+    
+    def live_expiries(self) -> List[Tuple[float, int, str]]:
+        """List (expiry, seq, key) for every stored entry that has a TTL."""
+        seq = self.heap_seq
+        return [(exp, next(seq), k) for k, (_, exp) in self.data.items() if exp > 0]
+    
+    def remove_expired(self, now: float, limit: Optional[int] = None) -> None:
+        """Remove entries that expired before ``now``, in O(k log n).
+        
+        At most ``limit`` heap items are examined (all expired ones if None).
+        """
+        heap = self.expiry_heap
+        popped = 0
+        while heap and heap[0][0] < now and popped != limit:
+            popped += 1
+            expiry, _, key = heapq.heappop(heap)
+            entry = self.data.get(key)
+            # Skip stale heap items whose entry is gone or carries a newer expiry
+            if entry is not None and entry[1] == expiry:
+                del self.data[key]
+                next(self.expired_removals)
+    
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        self.data.clear()
+        self.expiry_heap.clear()
+
+
+class _ClockShard(_Shard):
+    """A shard that approximates LRU with the CLOCK (second-chance) algorithm.
+    
+    Entries live in a fixed array of slots. Readers only set a slot's
+    referenced bit, so they never need the lock; writers sweep the clock hand
+    under the lock, clearing referenced bits until they reach an entry that
+    has not been read since the hand last passed it.
+    """
+    __slots__ = ("slots", "referenced", "free", "hand")
+    
+    def __init__(self, max_size: int):
+        super().__init__(max_size)
+        self.data: Dict[str, int] = {}  # Key -> slot index
+        # (key, value, expiry) per slot. Slots are only ever replaced with a new
+        # tuple, so a lock-free reader always sees a consistent entry.
+        self.slots: List[Optional[Tuple[str, Any, float]]] = [None] * max_size
+        self.referenced = bytearray(max_size)
+        self.free: List[int] = list(range(max_size - 1, -1, -1))  # Unused slot indexes
+        self.hand = 0
+    
+    def insert(self, key: str, value: Any, expiry: float) -> None:
+        """Store an entry, sweeping the clock hand for a victim if the shard is full.
+        
+        The caller holds the lock and indexes ``expiry`` in the expiry heap.
+        """
+        data = self.data
+        index = data.get(key)
+        if index is None:
+            free = self.free
+            if free:
+                index = free.pop()
+            elif self.max_size:
+                index = self.evict()
+            else:
+                # A zero-capacity shard evicts every new entry straight away
+                next(self.evictions)
+                return
+            data[key] = index
+        self.slots[index] = (key, value, expiry)
+    
+    def evict(self) -> int:
+        """Evict the first unreferenced entry and return its now unused slot."""
+        referenced = self.referenced
+        hand = self.hand
+        while referenced[hand]:
+            referenced[hand] = 0  # Second chance
+            hand = (hand + 1) % self.max_size
+        self.hand = (hand + 1) % self.max_size
+        
+        del self.data[self.slots[hand][0]]
+        next(self.evictions)
+        return hand
+    
+    def remove(self, key: str, index: int) -> None:
+        """Remove the entry for ``key`` stored in slot ``index``."""
+        del self.data[key]
+        self.release_slot(index)
+    
+    def release_slot(self, index: int) -> None:
+        """Empty slot ``index`` and return it to the free list."""
+        self.slots[index] = None
+        self.referenced[index] = 0
+        self.free.append(index)
+    
+    def live_expiries(self) -> List[Tuple[float, int, str]]:
+        """List (expiry, seq, key) for every stored entry that has a TTL."""
+        seq = self.heap_seq
+        return [(entry[2], next(seq), entry[0])
+                for entry in self.slots if entry is not None and entry[2] > 0]
+    
+    def remove_expired(self, now: float, limit: Optional[int] = None) -> None:
+        """Remove entries that expired before ``now``, in O(k log n).
+        
+        At most ``limit`` heap items are examined (all expired ones if None).
+        """
+        heap = self.expiry_heap
+        popped = 0
+        while heap and heap[0][0] < now and popped != limit:
+            popped += 1
+            expiry, _, key = heapq.heappop(heap)
+            index = self.data.get(key)
+            # Skip stale heap items whose entry is gone or carries a newer expiry
+            if index is not None and self.slots[index][2] == expiry:
+                self.remove(key, index)
+                next(self.expired_removals)
+    
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        super().clear()
+        self.slots = [None] * self.max_size
+        self.referenced = bytearray(self.max_size)
+        self.free = list(range(self.max_size - 1, -1, -1))
+        self.hand = 0
 
 
 class ThreadSafeCache:
-    """A thread-safe in-memory cache with LRU eviction and TTL support."""
+    """A thread-safe in-memory cache with LRU eviction and TTL support.
     
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None):
+    Keys are spread over ``num_shards`` independent shards, each with its own
+    lock, so operations on unrelated keys do not contend. LRU order and the
+    size limit are tracked per shard; with a single shard (the default) the
+    cache behaves as one global LRU.
+    
+    Shard locks are plain ``threading.Lock`` objects and are not re-entrant:
+    code running under a shard lock must never call back into the public
+    methods of the cache.
+    """
+    
+    _shard_class = _Shard
+    
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None,
+                 num_shards: int = 1, background_cleanup: bool = False):
         """Initialize the cache.
         
         Args:
             max_size: Maximum number of entries in the cache
             default_ttl: Default time-to-live in seconds (None means no expiration)
+            num_shards: Number of independently locked shards (a power of two,
+                no larger than max_size unless max_size is 0)
+            background_cleanup: Also sweep expired entries from a background
+                thread (they are otherwise removed a few at a time by get/put)
         """
+        if max_size < 0:
+            raise ValueError("max_size cannot be negative")
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError("num_shards must be a power of two")
+        if num_shards > max(max_size, 1):
+            raise ValueError("num_shards cannot exceed max_size")
+        
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.num_shards = num_shards
+        self.background_cleanup = background_cleanup
         
-        # Core data structures
-        self.cache: Dict[str, CacheNode] = {}  # Key-value store
-        self.head = CacheNode("", None)  # Dummy head for the doubly linked list
-        self.tail = CacheNode("", None)  # Dummy tail for the doubly linked list
-        self.head.next = self.tail
-        self.tail.prev = self.head
+        # Split the capacity across shards, handing the remainder to the first ones
+        base, extra = divmod(max_size, num_shards)
+        self._shards = [self._shard_class(base + (1 if i < extra else 0)) for i in range(num_shards)]
+        self._shard_mask = num_shards - 1
         
-        # Statistics
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
-        self.expired_removals = 0
+        # Serializes get_stats readers only; get/put never take it
+        self._stats_lock = threading.Lock()
         
-        # Thread safety
-        self.lock = threading.RLock()  # Reentrant lock for thread safety
-        
-        # Background cleanup thread
+        # Optional background cleanup thread, started only once entries can expire
         self.cleanup_interval = 60  # Cleanup every 60 seconds
-        self.cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
-        self.running = True
-        self.cleanup_thread.start()
+        self.cleanup_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._cleanup_start_lock = threading.Lock()
+        if background_cleanup and default_ttl is not None:
+            self._start_cleanup_thread()
     
     def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Insert a key-value pair with optional TTL.
@@ -67,35 +270,32 @@ class ThreadSafeCache:
             value: The value to store
             ttl: Time-to-live in seconds (None means use default_ttl)
         """
-        if key is None or key == "":
+        if not key:
             raise ValueError("Key cannot be None or empty")
         
-        with self.lock:
-            # Calculate expiry time
-            expiry = 0
-            if ttl is not None:
-                expiry = time.time() + ttl
-            elif self.default_ttl is not None:
-                expiry = time.time() + self.default_ttl
+        # Calculate expiry time, reusing one clock reading for the whole operation
+        now = _now()
+        expiry = 0
+        if ttl is not None:
+            expiry = now + ttl
+            if self.background_cleanup and self.cleanup_thread is None:
+                self._start_cleanup_thread()
+        elif self.default_ttl is not None:
+            expiry = now + self.default_ttl
+        
+        shard = self._shards[hash(key) & self._shard_mask]
+        with shard.lock:
+            heap = shard.expiry_heap
+            # Drop a few expired entries first, which may save an eviction
+            if heap and heap[0][0] < now:
+                shard.remove_expired(now, _EXPIRED_PER_OP)
             
-            # Check if key already exists
-            if key in self.cache:
-                # Update existing entry
-                node = self.cache[key]
-                node.value = value
-                node.expiry = expiry
-                # Move to front (most recently used)
-                self._remove_node(node)
-                self._add_to_front(node)
-            else:
-                # Create new entry
-                node = CacheNode(key, value, expiry)
-                self.cache[key] = node
-                self._add_to_front(node)
-                
-                # Check if we need to evict
-                if len(self.cache) > self.max_size:
-                    self._evict_lru()
+            shard.insert(key, value, expiry)
+            # A zero-capacity shard never keeps the entry, so there is nothing to index
+            if expiry > 0 and shard.max_size:
+                heapq.heappush(heap, (expiry, next(shard.heap_seq), key))
+                if len(heap) > 2 * shard.max_size:
+                    shard.rebuild_expiry_heap()
     
     def get(self, key: str) -> Any:
         """Retrieve a value by key and update access order.
@@ -106,27 +306,34 @@ class ThreadSafeCache:
         Returns:
             The value or None if not found or expired
         """
-        with self.lock:
-            if key in self.cache:
-                node = self.cache[key]
+        now = _now()
+        shard = self._shards[hash(key) & self._shard_mask]
+        with shard.lock:
+            data = shard.data
+            entry = data.get(key)
+            if entry is not None:
+                value, expiry = entry
                 
                 # Check if expired
-                if self._is_expired(node):
-                    self._remove_node(node)
-                    del self.cache[key]
-                    self.expired_removals += 1
-                    self.misses += 1
-                    return None
-                
-                # Move to front (most recently used)
-                self._remove_node(node)
-                self._add_to_front(node)
-                
-                self.hits += 1
-                return node.value
-            else:
-                self.misses += 1
-                return None
+                if expiry and now > expiry:
+                    del data[key]
+                    next(shard.expired_removals)
+                    entry = None
+                else:
+                    # Mark as most recently used
+                    data.move_to_end(key)
+            
+            # Amortize TTL cleanup: drop a few other expired entries
+            heap = shard.expiry_heap
+            if heap and heap[0][0] < now:
+                shard.remove_expired(now, _EXPIRED_PER_OP)
+        
+        # Hit/miss accounting does not need the lock
+        if entry is None:
+            next(shard.misses)
+            return None
+        next(shard.hits)
+        return value
     
     def delete(self, key: str) -> bool:
         """Remove a specific key from the cache.
@@ -137,119 +344,223 @@ class ThreadSafeCache:
         Returns:
             True if the key was found and deleted, False otherwise
         """
-        with self.lock:
-            if key in self.cache:
-                node = self.cache[key]
-                self._remove_node(node)
-                del self.cache[key]
-                return True
-            return False
+        shard = self._shards[hash(key) & self._shard_mask]
+        with shard.lock:
+            # Entries are tuples, so None can only mean the key was absent
+            return shard.data.pop(key, None) is not None
     
     def clear(self) -> None:
         """Empty the entire cache."""
-        with self.lock:
-            self.cache.clear()
-            # Reset the linked list
-            self.head.next = self.tail
-            self.tail.prev = self.head
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
     
     def get_stats(self) -> CacheStats:
         """Get cache statistics.
         
+        No shard lock is taken, so polling stats never stalls cache operations;
+        concurrent get_stats callers only serialize among themselves. Each
+        counter is read atomically, but they are not read at the same instant:
+        under concurrent load a snapshot may be momentarily inconsistent (e.g.
+        hits and misses off by one relative to each other).
+        
         Returns:
             A dictionary with cache statistics
         """
-        with self.lock:
-            total_requests = self.hits + self.misses
-            hit_rate = self.hits / total_requests if total_requests > 0 else 0
-            
-            return {
-                "hits": self.hits,
-                "misses": self.misses,
-                "hit_rate": hit_rate,
-                "total_requests": total_requests,
-                "current_size": len(self.cache),
-                "evictions": self.evictions,
-                "expired_removals": self.expired_removals
-            }
-    
-    def _add_to_front(self, node: CacheNode) -> None:
-        """Add a node to the front of the doubly linked list (most recently used)."""
-        node.next = self.head.next
-        node.prev = self.head
-        self.head.next.prev = node
-        self.head.next = node
-    
-    def _remove_node(self, node: CacheNode) -> None:
-        """Remove a node from the doubly linked list."""
-        node.prev.next = node.next
-        node.next.prev = node.prev
-    
-    def _evict_lru(self) -> None:
-        """Evict the least recently used item from the cache."""
-        if not self.cache:  # Safety check
-            return
+        hits = misses = current_size = evictions = expired_removals = 0
+        # Reading advances every counter by one; the lock keeps concurrent
+        # readers from interleaving and subtracting each other's reads
+        with self._stats_lock:
+            for shard in self._shards:
+                reads = next(shard.snapshots)
+                hits += next(shard.hits) - reads
+                misses += next(shard.misses) - reads
+                current_size += len(shard.data)
+                evictions += next(shard.evictions) - reads
+                expired_removals += next(shard.expired_removals) - reads
+        
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0
+        
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hit_rate,
+            "total_requests": total_requests,
+            "current_size": current_size,
+            "evictions": evictions,
+            "expired_removals": expired_removals
+        }
+    
+    def _start_cleanup_thread(self) -> None:
+        """Start the background cleanup thread unless it is running or the cache is shut down."""
+        with self._cleanup_start_lock:
+            if self.cleanup_thread is None and not self._stop_event.is_set():
+                self.cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
+                self.cleanup_thread.start()
+    
+    def _cleanup_worker(self) -> None:
+        """Background worker that periodically removes expired entries."""
+        # wait() returns True as soon as shutdown() sets the event
+        while not self._stop_event.wait(self.cleanup_interval):
+            self._cleanup_expired()
+    
+    def _cleanup_expired(self) -> None:
+        """Remove all expired entries from the cache, one shard at a time."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.remove_expired(_now())
+    
+    def shutdown(self) -> None:
+        """Shutdown the cache and stop the cleanup thread."""
+        with self._cleanup_start_lock:
+            self._stop_event.set()
+        if self.cleanup_thread is not None:
+            self.cleanup_thread.join()
+
+
+class _NoTTLCache(ThreadSafeCache):
+    """A ThreadSafeCache specialized for caches whose entries never expire.
+    
+    ``create_cache`` returns this when no ``default_ttl`` is given. Its ``get``
+    and ``put`` skip every expiry check, clock read and heap operation.
+    
+    The first ``put`` that passes ``ttl`` switches the instance to the general
+    implementation for good by reassigning ``__class__`` to ThreadSafeCache.
+    From then on ``isinstance(cache, _NoTTLCache)`` is False, so callers must
+    not rely on this type; ``isinstance(cache, ThreadSafeCache)`` always holds.
+    """
+    
+    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Insert a key-value pair with optional TTL.
         
-        # The LRU node is at the end of the list (just before tail)
-        lru_node = self.tail.prev
-        if lru_node == self.head:  # Safety check
+        Args:
+            key: The key to store
+            value: The value to store
+            ttl: Time-to-live in seconds (None means no expiration)
+        """
+        if not key:
+            raise ValueError("Key cannot be None or empty")
+        if ttl is not None:
+            # Entries can expire from now on: fall back to the general implementation
+            self.__class__ = ThreadSafeCache
+            ThreadSafeCache.put(self, key, value, ttl)
             return
         
-        # Remove from linked list and dictionary
-        self._remove_node(lru_node)
-        del self.cache[lru_node.key]
-        self.evictions += 1
+        shard = self._shards[hash(key) & self._shard_mask]
+        with shard.lock:
+            shard.insert(key, value, 0)
     
-    def _is_expired(self, node: CacheNode) -> bool:
-        """Check if a cache entry has expired.
+    def get(self, key: str) -> Any:
+        """Retrieve a value by key and update access order.
         
         Args:
-            node: The cache node to check
+            key: The key to retrieve
             
         Returns:
-            True if expired, False otherwise
+            The value or None if not found
         """
-        return node.expiry > 0 and time.time() > node.expiry
+        shard = self._shards[hash(key) & self._shard_mask]
+        with shard.lock:
+            data = shard.data
+            entry = data.get(key)
+            if entry is not None:
+                data.move_to_end(key)
+        
+        if entry is None:
+            next(shard.misses)
+            return None
+        next(shard.hits)
+        return entry[0]
+
+
+class ClockCache(ThreadSafeCache):
+    """A thread-safe cache that evicts with CLOCK (second-chance) instead of exact LRU.
     
-    def _cleanup_worker(self) -> None:
-        """Background worker that periodically removes expired entries."""
-        while self.running:
-            time.sleep(self.cleanup_interval)
-            self._cleanup_expired()
+    ``get`` does not take any lock: it looks up the key's slot and sets the
+    slot's referenced bit, relying on individual dict, list and bytearray
+    operations being atomic under the GIL. ``put`` and ``delete`` still take
+    the shard lock. Because reads never reorder anything, read-heavy workloads
+    do not serialize on the shard locks, at the cost of evicting an entry
+    that is merely "not recently used" rather than the exact LRU one.
     
-    def _cleanup_expired(self) -> None:
-        """Remove all expired entries from the cache."""
-        with self.lock:
-            # Create a list of expired keys to avoid modifying the dictionary during iteration
-            expired_keys = []
-            current_time = time.time()
-            
-            for key, node in self.cache.items():
-                if node.expiry > 0 and current_time > node.expiry:
-                    expired_keys.append(key)
+    To keep reads lock-free, amortized TTL cleanup only runs in ``put``.
+    """
+    
+    _shard_class = _ClockShard
+    
+    def get(self, key: str) -> Any:
+        """Retrieve a value by key and mark it as recently used.
+        
+        Args:
+            key: The key to retrieve
             
-            # Remove expired entries
-            for key in expired_keys:
-                node = self.cache[key]
-                self._remove_node(node)
-                del self.cache[key]
-                self.expired_removals += 1
+        Returns:
+            The value or None if not found or expired
+        """
+        shard = self._shards[hash(key) & self._shard_mask]
+        index = shard.data.get(key)
+        entry = shard.slots[index] if index is not None else None
+        # The slot may have been reused for another key since the index lookup
+        if entry is None or entry[0] != key:
+            next(shard.misses)
+            return None
+        
+        # Check if expired
+        expiry = entry[2]
+        if expiry and _now() > expiry:
+            with shard.lock:
+                # Only remove it if a concurrent put has not replaced it meanwhile
+                if shard.data.get(key) == index and shard.slots[index] is entry:
+                    shard.remove(key, index)
+                    next(shard.expired_removals)
+            next(shard.misses)
+            return None
+        
+        shard.referenced[index] = 1
+        next(shard.hits)
+        return entry[1]
     
-    def shutdown(self) -> None:
-        """Shutdown the cache and stop the cleanup thread."""
-        self.running = False
-        if self.cleanup_thread.is_alive():
-            self.cleanup_thread.join(timeout=1.0)
+    def delete(self, key: str) -> bool:
+        """Remove a specific key from the cache.
+        
+        Args:
+            key: The key to delete
+            
+        Returns:
+            True if the key was found and deleted, False otherwise
+        """
+        shard = self._shards[hash(key) & self._shard_mask]
+        with shard.lock:
+            index = shard.data.pop(key, None)
+            if index is None:
+                return False
+            shard.release_slot(index)
+            return True
 
 
-def create_cache(max_size: int = 1000, default_ttl: Optional[int] = None) -> ThreadSafeCache:
+def create_cache(max_size: int = 1000, default_ttl: Optional[int] = None,
+                 num_shards: int = 1, eviction_policy: str = "lru",
+                 background_cleanup: bool = False) -> ThreadSafeCache:
     """Factory function to create a new cache instance.
     
     Args:
         max_size: Maximum number of entries in the cache
         default_ttl: Default time-to-live in seconds (None means no expiration)
+        num_shards: Number of independently locked shards (a power of two)
+        eviction_policy: "lru" for LRU eviction (an overflowing shard of 128+
+            entries evicts its max_size // 64 least recently used entries at
+            once, so it then holds fewer than max_size), or "clock" for CLOCK
+            eviction with lock-free reads
+        background_cleanup: Also sweep expired entries from a background thread
         
     Returns:
-        A new ThreadSafeCache instance
+        A new ThreadSafeCache (or ClockCache) instance
     """
-    return ThreadSafeCache(max_size, default_ttl)
\ No newline at end of file
+    if eviction_policy == "lru":
+        if default_ttl is None:
+            return _NoTTLCache(max_size, default_ttl, num_shards, background_cleanup)
+        return ThreadSafeCache(max_size, default_ttl, num_shards, background_cleanup)
+    if eviction_policy == "clock":
+        return ClockCache(max_size, default_ttl, num_shards, background_cleanup)
+    raise ValueError(f"Unknown eviction policy: {eviction_policy}")
\ No newline at end of file
@@ -1,7 +1,8 @@
 import unittest
 import time
 import threading
-from cache import create_cache
+from unittest import mock
+from cache import ThreadSafeCache, create_cache
 
 
 class TestThreadSafeCache(unittest.TestCase):
@@ -68,6 +69,96 @@ class TestThreadSafeCache(unittest.TestCase):
         # Cleanup
         cache_with_short_ttl.shutdown()
     
+    def test_cleanup_expired(self):
+        """Test that cleanup removes only entries that are still expired."""
+        self.cache.put("short1", "value1", ttl=1)
+        self.cache.put("short2", "value2", ttl=1)
+        self.cache.put("long", "value3")
+        
+        # Re-put with a longer TTL and delete: the old expiry times are stale
+        self.cache.put("short2", "value2", ttl=60)
+        self.cache.put("deleted", "value4", ttl=1)
+        self.cache.delete("deleted")
+        
+        # Wait for expiration
+        time.sleep(1.5)
+        
+        self.cache._cleanup_expired()
+        
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["expired_removals"], 1)
+        self.assertEqual(stats["current_size"], 2)
+        self.assertEqual(self.cache.get("short2"), "value2")
+        self.assertEqual(self.cache.get("long"), "value3")
+    
+    def test_amortized_expiry(self):
+        """Test that get/put remove expired entries without a cleanup thread."""
+        self.assertIsNone(self.cache.cleanup_thread)
+        
+        self.cache.put("temp1", "value1", ttl=1)
+        self.cache.put("temp2", "value2", ttl=1)
+        
+        # Wait for expiration
+        time.sleep(1.5)
+        
+        # An unrelated put clears both expired entries
+        self.cache.put("fresh", "value3")
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["expired_removals"], 2)
+        self.assertEqual(stats["current_size"], 1)
+    
+    def test_cleanup_thread_lifecycle(self):
+        """Test that the cleanup thread starts lazily and stops promptly."""
+        # A cache without any TTL never needs the cleanup thread
+        no_ttl_cache = create_cache(max_size=10, background_cleanup=True)
+        no_ttl_cache.put("key", "value")
+        self.assertIsNone(no_ttl_cache.cleanup_thread)
+        
+        # The first per-key TTL starts it
+        no_ttl_cache.put("temp", "value", ttl=60)
+        self.assertTrue(no_ttl_cache.cleanup_thread.is_alive())
+        
+        # Shutdown wakes the sleeping worker instead of waiting out the interval
+        start = time.monotonic()
+        no_ttl_cache.shutdown()
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertFalse(no_ttl_cache.cleanup_thread.is_alive())
+        
+        # A cache with a default TTL starts it right away
+        ttl_cache = create_cache(max_size=10, default_ttl=60, background_cleanup=True)
+        self.assertTrue(ttl_cache.cleanup_thread.is_alive())
+        ttl_cache.shutdown()
+    
+    def test_unorderable_keys_with_equal_expiry(self):
+        """Test that keys sharing an expiry time are never compared with each other."""
+        class Key:
+            def __init__(self, n):
+                self.n = n
+            
+            def __eq__(self, other):
+                return isinstance(other, Key) and self.n == other.n
+            
+            def __hash__(self):
+                return hash(self.n)
+        
+        for policy in ("lru", "clock"):
+            ttl_cache = create_cache(max_size=10, default_ttl=60, eviction_policy=policy)
+            # Freeze the clock so both entries get exactly the same expiry
+            with mock.patch("cache._now", return_value=1000.0):
+                ttl_cache.put(Key(1), "value1")
+                ttl_cache.put(Key(2), "value2")
+                ttl_cache.put(1, "int key")
+                ttl_cache.put("1", "str key")
+                self.assertEqual(ttl_cache.get(Key(2)), "value2")
+            
+            # Both still expire together once the deadline passes
+            with mock.patch("cache._now", return_value=2000.0):
+                ttl_cache._cleanup_expired()
+            self.assertEqual(ttl_cache.get_stats()["expired_removals"], 4)
+            
+            # Cleanup
+            ttl_cache.shutdown()
+    
     def test_lru_eviction(self):
         """Test that least recently used items are evicted when cache is full."""
         # Fill the cache to capacity (max_size=10)
@@ -96,6 +187,23 @@ class TestThreadSafeCache(unittest.TestCase):
             self.assertEqual(self.cache.get(f"key{i}"), f"value{i}")
         self.assertEqual(self.cache.get("new_key"), "new_value")
     
+    def test_batch_eviction(self):
+        """Test that a full large cache evicts a batch of LRU entries at once."""
+        large_cache = create_cache(max_size=128)  # Evicts 128 // 64 = 2 at a time
+        for i in range(129):
+            large_cache.put(f"key{i}", f"value{i}")
+        
+        stats = large_cache.get_stats()
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["current_size"], 127)
+        self.assertIsNone(large_cache.get("key0"))
+        self.assertIsNone(large_cache.get("key1"))
+        self.assertEqual(large_cache.get("key2"), "value2")
+        self.assertEqual(large_cache.get("key128"), "value128")
+        
+        # Cleanup
+        large_cache.shutdown()
+    
     def test_statistics(self):
         """Test that cache statistics are tracked correctly."""
         # Initial stats
@@ -148,6 +256,58 @@ class TestThreadSafeCache(unittest.TestCase):
         # Cleanup
         cache_for_expiration.shutdown()
     
+    def test_cache_without_ttl(self):
+        """Test that a cache without default TTL upgrades on the first per-key TTL."""
+        no_ttl_cache = create_cache(max_size=3)
+        self.assertIsInstance(no_ttl_cache, ThreadSafeCache)
+        self.assertIsNot(type(no_ttl_cache), ThreadSafeCache)
+        
+        for i in range(4):
+            no_ttl_cache.put(f"key{i}", f"value{i}")
+        self.assertIsNone(no_ttl_cache.get("key0"))
+        self.assertEqual(no_ttl_cache.get("key1"), "value1")
+        
+        # A per-key TTL switches to the general implementation
+        no_ttl_cache.put("temp", "value", ttl=0)
+        self.assertIs(type(no_ttl_cache), ThreadSafeCache)
+        self.assertIsNone(no_ttl_cache.get("temp"))
+        
+        stats = no_ttl_cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["expired_removals"], 1)
+        
+        # Cleanup
+        no_ttl_cache.shutdown()
+    
+    def test_concurrent_stats_polling(self):
+        """Test that concurrent get_stats calls report exact counts on an idle cache."""
+        stats_cache = create_cache(max_size=2, num_shards=2)
+        for i in range(3):
+            stats_cache.put(f"key{i}", f"value{i}")
+        for i in range(3):
+            stats_cache.get(f"key{i}")
+        expected = stats_cache.get_stats()
+        wrong_snapshots = []
+        
+        def poller():
+            for _ in range(2000):
+                stats = stats_cache.get_stats()
+                if stats != expected:
+                    wrong_snapshots.append(stats)
+        
+        threads = [threading.Thread(target=poller) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        self.assertEqual(wrong_snapshots, [])
+        
+        # Cleanup
+        stats_cache.shutdown()
+    
     def test_concurrent_access(self):
         """Test that the cache handles concurrent access correctly."""
         # Create a larger cache for concurrent testing
@@ -180,6 +340,112 @@ class TestThreadSafeCache(unittest.TestCase):
         # Cleanup
         concurrent_cache.shutdown()
     
+    def test_sharded_cache(self):
+        """Test that a sharded cache spreads keys and respects the size limit."""
+        sharded_cache = create_cache(max_size=64, num_shards=4)
+        
+        def worker(thread_id):
+            for i in range(50):
+                sharded_cache.put(f"thread_{thread_id}:item_{i}", f"data_{i}")
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        # Every shard is full, so the cache holds exactly max_size entries
+        stats = sharded_cache.get_stats()
+        self.assertEqual(stats["current_size"], 64)
+        self.assertEqual(stats["evictions"], 200 - 64)
+        
+        # Entries remain retrievable after being routed to their shard
+        sharded_cache.put("shared", "value")
+        self.assertEqual(sharded_cache.get("shared"), "value")
+        self.assertTrue(sharded_cache.delete("shared"))
+        
+        # Cleanup
+        sharded_cache.shutdown()
+        
+        # Invalid shard counts are rejected
+        with self.assertRaises(ValueError):
+            create_cache(max_size=64, num_shards=3)
+        with self.assertRaises(ValueError):
+            create_cache(max_size=2, num_shards=4)
+    
+    def test_clock_eviction(self):
+        """Test CLOCK eviction and lock-free reads."""
+        clock_cache = create_cache(max_size=3, eviction_policy="clock")
+        for key in ("a", "b", "c"):
+            clock_cache.put(key, key.upper())
+        
+        # Reading "a" gives it a second chance, so "b" is evicted instead
+        self.assertEqual(clock_cache.get("a"), "A")
+        clock_cache.put("d", "D")
+        self.assertIsNone(clock_cache.get("b"))
+        for key in ("a", "c", "d"):
+            self.assertEqual(clock_cache.get(key), key.upper())
+        
+        # Update, delete and clear
+        clock_cache.put("a", "updated")
+        self.assertEqual(clock_cache.get("a"), "updated")
+        self.assertTrue(clock_cache.delete("a"))
+        self.assertIsNone(clock_cache.get("a"))
+        clock_cache.put("e", "E")
+        self.assertEqual(clock_cache.get_stats()["current_size"], 3)
+        clock_cache.clear()
+        self.assertIsNone(clock_cache.get("e"))
+        self.assertEqual(clock_cache.get_stats()["current_size"], 0)
+        
+        # Cleanup
+        clock_cache.shutdown()
+        
+        # Concurrent readers and writers
+        concurrent_cache = create_cache(max_size=100, num_shards=4, eviction_policy="clock")
+        wrong_values = []
+        
+        def worker(thread_id):
+            for i in range(200):
+                concurrent_cache.put(f"thread_{thread_id}:item_{i}", i)
+                value = concurrent_cache.get(f"thread_{thread_id}:item_{i // 2}")
+                if value not in (None, i // 2):
+                    wrong_values.append(value)
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        self.assertEqual(wrong_values, [])
+        self.assertEqual(concurrent_cache.get_stats()["current_size"], 100)
+        
+        # Cleanup
+        concurrent_cache.shutdown()
+        
+        with self.assertRaises(ValueError):
+            create_cache(eviction_policy="fifo")
+    
+    def test_zero_size_cache(self):
+        """Test that a cache with max_size=0 evicts every entry immediately."""
+        for policy in ("lru", "clock"):
+            zero_cache = create_cache(max_size=0, default_ttl=60, eviction_policy=policy)
+            zero_cache.put("key", "value")
+            self.assertIsNone(zero_cache.get("key"))
+            
+            stats = zero_cache.get_stats()
+            self.assertEqual(stats["evictions"], 1)
+            self.assertEqual(stats["current_size"], 0)
+            
+            # Entries that were never kept are not indexed for expiry
+            self.assertEqual(zero_cache._shards[0].expiry_heap, [])
+            
+            # Cleanup
+            zero_cache.shutdown()
+        
+        with self.assertRaises(ValueError):
+            create_cache(max_size=-1)
+    
     def test_invalid_keys(self):
         """Test handling of invalid keys."""
         with self.assertRaises(ValueError):